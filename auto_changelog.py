@@ -4,147 +4,354 @@
 Git의 변경사항을 감지하여 자동으로 changelog를 생성합니다.
 """
 
-import subprocess
+import asyncio
+import os
+import signal
 import sys
 from datetime import datetime
 from code_changelog_tracker import CodeChangeLogger
+from changelog_ignore import load_ignore_matcher
 
 
-def get_git_diff():
-    """Git diff를 가져옵니다 (staged + unstaged)"""
+# git 명령 하나가 끝나기를 기다리는 최대 시간 (초)
+GIT_TIMEOUT = 10
+# 동시에 실행할 git 프로세스 수
+GIT_CONCURRENCY = 4
+# 여러 프로젝트가 함께 쓰는 reviews 폴더 (설정하면 <폴더>/<프로젝트>/<yyyy>/<mm>/에 기록)
+SHARED_REVIEWS_ENV = "CHANGELOG_REVIEWS_DIR"
+
+
+class GitError(Exception):
+    """git 명령 실패 또는 시간 초과"""
+
+
+def _kill_process_group(proc):
+    """git과 git이 띄운 하위 프로세스(hook, alias 등)까지 종료"""
     try:
-        # Staged changes
-        staged = subprocess.run(
-            ['git', 'diff', '--cached', '--name-status'],
-            capture_output=True,
-            text=True,
-            check=True
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        proc.kill()
+
+
+async def run_git(args, semaphore, timeout=None):
+    """
+    git 명령을 비동기로 실행하고 stdout을 반환
+
+    Args:
+        args: git 뒤에 붙일 인자 목록
+        semaphore: 동시 실행 수 제한용 asyncio.Semaphore
+        timeout: 최대 대기 시간 (초, 기본: GIT_TIMEOUT). 넘으면 프로세스를 죽이고 GitError
+    """
+    if timeout is None:
+        timeout = GIT_TIMEOUT
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            'git', *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            # index.lock 대기 등으로 멈춘 git은 기다리지 않고 종료
+            _kill_process_group(proc)
+            await proc.wait()
+            raise GitError(f"git {' '.join(args)}: {timeout}초 안에 끝나지 않았습니다")
+
+    if proc.returncode != 0:
+        message = stderr.decode('utf-8', errors='replace').strip()
+        raise GitError(f"git {' '.join(args)}: {message}")
+    return stdout.decode('utf-8', errors='replace')
+
+
+def parse_name_status(output):
+    """
+    git diff --name-status -z 출력을 변경 목록으로 변환
+
+    Returns:
+        [{"status": "A"|"M"|"D"|"R"|"C"|..., "path": 경로,
+          "old_path": 이전 경로(R/C만), "similarity": 유사도(R/C만)}, ...]
+    """
+    fields = output.split('\0')
+    changes = []
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+        if not status:
+            i += 1
+            continue
 
-        # Unstaged changes
-        unstaged = subprocess.run(
-            ['git', 'diff', '--name-status'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        kind = status[0]
+        if kind in 'RC' and i + 2 < len(fields):
+            # 이름 변경/복사: 상태, 이전 경로, 새 경로
+            changes.append({
+                "status": kind,
+                "path": fields[i + 2],
+                "old_path": fields[i + 1],
+                "similarity": int(status[1:] or 100),
+            })
+            i += 3
+        elif i + 1 < len(fields):
+            changes.append({"status": kind, "path": fields[i + 1]})
+            i += 2
+        else:
+            break
+    return changes
+
+
+def merge_change_sets(staged, unstaged):
+    """
+    staged/unstaged 변경을 경로별로 하나씩만 남도록 합침
+
+    같은 파일이 양쪽에 있으면 staged 쪽 상태(A/R/C/M)를 유지하고,
+    작업 트리에서 지워진 경우에만 삭제로 바꾼다. 이름 변경/복사한 뒤 작업 트리에서
+    더 고친 경로는 R/C 그대로 두되 unstaged=True로 표시한다
+    (parse_diff_and_log가 이동/복사와 함께 그 수정도 기록).
+    """
+    merged = {}
+    for change in staged:
+        merged[change["path"]] = dict(change, staged=True, unstaged=False)
+
+    for change in unstaged:
+        path = change["path"]
+        existing = merged.get(path)
+        if existing is None:
+            merged[path] = dict(change, staged=False, unstaged=True)
+            continue
 
-        return staged.stdout + unstaged.stdout
-    except subprocess.CalledProcessError:
-        return ""
+        existing["unstaged"] = True
+        if change["status"] != 'D':
+            continue
 
+        del merged[path]
+        if existing["status"] == 'R':
+            # 이름을 바꾼 뒤 작업 트리에서 지움 -> 원래 파일 삭제
+            old_path = existing["old_path"]
+            merged[old_path] = {"status": 'D', "path": old_path, "staged": True, "unstaged": True}
+        elif existing["status"] not in ('A', 'C'):
+            merged[path] = dict(change, staged=True, unstaged=True)
+        # 새로 추가(복사)했다가 작업 트리에서 지운 파일은 HEAD에 없으므로 기록하지 않음
 
-def get_file_diff(filepath, staged=False):
-    """특정 파일의 diff를 가져옵니다"""
+    return merged
+
+
+async def get_change_set_async(semaphore):
+    """staged + unstaged 변경을 이름 변경/복사 감지(-M/-C)와 함께 경로별로 합쳐 조회"""
+    args = ['diff', '--name-status', '-z', '-M', '-C']
     try:
-        cmd = ['git', 'diff']
-        if staged:
-            cmd.append('--cached')
-        cmd.append(filepath)
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
+        staged, unstaged = await asyncio.gather(
+            run_git(args[:1] + ['--cached'] + args[1:], semaphore),
+            run_git(args, semaphore)
         )
-        return result.stdout
-    except subprocess.CalledProcessError:
+    except GitError as e:
+        print(f"  경고: {e}")
+        return {}
+    return merge_change_sets(parse_name_status(staged), parse_name_status(unstaged))
+
+
+async def get_file_diff_async(filepath, semaphore, staged=False, head=False, old_path=None):
+    """
+    특정 파일의 diff를 가져옵니다
+
+    staged면 index 기준(--cached), head면 HEAD와 작업 트리 비교
+    (staged와 unstaged 변경을 함께 포함), 둘 다 아니면 작업 트리 diff.
+    old_path를 주면 이동/복사 원본과 짝지어 HEAD 기준으로 비교한다.
+    """
+    args = ['diff']
+    if old_path is not None:
+        args += ['HEAD', '-C', '--find-copies-harder', '--', old_path, filepath]
+    else:
+        if head:
+            args.append('HEAD')
+        elif staged:
+            args.append('--cached')
+        args += ['--', filepath]
+
+    try:
+        return await run_git(args, semaphore)
+    except GitError as e:
+        print(f"  경고: {e}")
         return ""
 
 
-def get_last_commit_message():
+async def get_last_commit_message_async(semaphore):
     """마지막 커밋 메시지를 가져옵니다"""
     try:
-        result = subprocess.run(
-            ['git', 'log', '-1', '--pretty=%B'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
+        return (await run_git(['log', '-1', '--pretty=%B'], semaphore)).strip()
+    except GitError:
         return "변경사항"
 
 
+# 이 모듈을 import하는 외부 스크립트용으로 기존 동기 함수 이름을 유지 (모듈 안에서는 쓰지 않음)
+def _run(coro_func, *args):
+    """동시 실행 제한을 걸어 코루틴 하나를 실행"""
+    async def runner():
+        semaphore = asyncio.Semaphore(GIT_CONCURRENCY)
+        return await coro_func(*args, semaphore)
+    return asyncio.run(runner())
+
+
+def get_file_diff(filepath, staged=False):
+    """특정 파일의 diff를 가져옵니다"""
+    async def query(semaphore):
+        return await get_file_diff_async(filepath, semaphore, staged)
+    return _run(query)
+
+
+def get_last_commit_message():
+    """마지막 커밋 메시지를 가져옵니다"""
+    return _run(get_last_commit_message_async)
+
+
+async def collect_git_state(need_message):
+    """변경 파일 목록과 (필요하면) 마지막 커밋 메시지를 동시에 조회"""
+    semaphore = asyncio.Semaphore(GIT_CONCURRENCY)
+    if not need_message:
+        return await get_change_set_async(semaphore), ""
+    return await asyncio.gather(
+        get_change_set_async(semaphore),
+        get_last_commit_message_async(semaphore)
+    )
+
+
+async def collect_file_diffs(changes):
+    """
+    여러 파일의 diff를 동시에 조회 (경로 -> diff)
+
+    staged에만 있는 변경은 --cached diff, 작업 트리에만 있는 변경은 작업 트리 diff,
+    양쪽에 다 있으면 HEAD 기준 diff를 가져온다 (staged 변경이 빠지지 않도록).
+    이동/복사(R/C)는 원본 경로와 짝지은 HEAD 기준 diff를 가져온다.
+    """
+    semaphore = asyncio.Semaphore(GIT_CONCURRENCY)
+    diffs = await asyncio.gather(
+        *(get_file_diff_async(
+            change["path"], semaphore,
+            staged=not change["unstaged"],
+            head=change["staged"] and change["unstaged"],
+            old_path=change.get("old_path")
+        ) for change in changes)
+    )
+    return {change["path"]: diff for change, diff in zip(changes, diffs)}
+
+
 def parse_diff_and_log(commit_message=""):
     """Git diff를 분석하여 changelog에 기록"""
 
-    diff_output = get_git_diff()
-    if not diff_output:
+    # 커밋 메시지가 없으면 마지막 커밋 메시지 사용 (diff와 동시에 조회)
+    change_set, last_message = asyncio.run(collect_git_state(not commit_message))
+    if not change_set:
         print("변경된 파일이 없습니다.")
         return False
 
     # 프로젝트명 추출 (현재 디렉토리 이름)
-    import os
     project_name = os.path.basename(os.getcwd())
 
-    # 커밋 메시지가 없으면 마지막 커밋 메시지 사용
     if not commit_message:
-        commit_message = get_last_commit_message()
+        commit_message = last_message
+
+    # Logger 생성 (공용 reviews 폴더가 설정되어 있으면 프로젝트별 샤드에 기록)
+    shared_reviews_dir = os.environ.get(SHARED_REVIEWS_ENV)
+    if shared_reviews_dir:
+        logger = CodeChangeLogger(
+            f"{project_name} - 자동 변경 기록",
+            user_request=commit_message,
+            reviews_dir=shared_reviews_dir,
+            project=project_name
+        )
+    else:
+        logger = CodeChangeLogger(
+            f"{project_name} - 자동 변경 기록",
+            user_request=commit_message
+        )
 
-    # Logger 생성
-    logger = CodeChangeLogger(
-        f"{project_name} - 자동 변경 기록",
-        user_request=commit_message
-    )
+    # 변경된 파일 목록 정리 (경로별로 한 번씩)
+    # reviews 폴더, 빌드 산출물 등은 기본 규칙 + .changelogignore 로 제외
+    ignore = load_ignore_matcher()
+    entries = [change for change in change_set.values() if not ignore.match(change["path"])]
+
+    # 수정된 파일들의 diff는 한 번에 동시 조회
+    # (이동/복사한 뒤 작업 트리에서 더 고친 파일 포함)
+    modified = [
+        change for change in entries
+        if change["status"] == 'M' or (change["status"] in 'RC' and change["unstaged"])
+    ]
+    file_diffs = asyncio.run(collect_file_diffs(modified)) if modified else {}
 
     # 변경된 파일 분석
     changes_logged = False
-    for line in diff_output.strip().split('\n'):
-        if not line:
-            continue
-
-        parts = line.split('\t')
-        if len(parts) < 2:
-            continue
-
-        status = parts[0]
-        filepath = parts[1]
-
-        # reviews 폴더는 제외
-        if filepath.startswith('reviews/'):
-            continue
-
-        # Python 캐시, 빌드 파일 등 제외
-        if any(x in filepath for x in ['__pycache__', '.pyc', 'build/', '.git/', 'node_modules/']):
-            continue
-
+    for change in entries:
+        status = change["status"]
+        filepath = change["path"]
         try:
-            if status.startswith('A'):
+            if status == 'A':
                 # 새 파일 추가
                 with open(filepath, 'r', encoding='utf-8') as f:
                     content = f.read()
                 logger.log_file_creation(
                     filepath,
-                    content[:500],  # 처음 500자만
+                    content,  # 미리보기 이후 내용은 logger가 별도 파일로 보관
                     f"새 파일 추가: {commit_message}"
                 )
                 changes_logged = True
                 print(f"  [추가] {filepath}")
 
-            elif status.startswith('M'):
+            elif status == 'M':
                 # 파일 수정
-                diff = get_file_diff(filepath)
                 logger.log_file_modification(
                     filepath,
                     "이전 버전 (git diff 참조)",
                     "새 버전 (git diff 참조)",
-                    f"파일 수정: {commit_message}"
+                    f"파일 수정: {commit_message}",
+                    diff=file_diffs.get(filepath)
                 )
                 changes_logged = True
                 print(f"  [수정] {filepath}")
 
-            elif status.startswith('D'):
-                # 파일 삭제
+            elif status == 'D':
+                # 파일 삭제 (지운 내용은 읽지 않으므로 빈 내용 -> 전체 내용 파일도 만들지 않음)
                 logger.log_file_deletion(
                     filepath,
-                    "삭제된 파일",
+                    "",
                     f"파일 삭제: {commit_message}"
                 )
                 changes_logged = True
                 print(f"  [삭제] {filepath}")
 
+            elif status == 'R':
+                # 이름 변경 (내용은 다시 읽지 않음)
+                logger.log_file_rename(
+                    change["old_path"],
+                    filepath,
+                    f"파일 이동: {commit_message}",
+                    similarity=change["similarity"]
+                )
+                changes_logged = True
+                print(f"  [이동] {change['old_path']} -> {filepath}")
+
+            elif status == 'C':
+                # 복사 (내용은 다시 읽지 않음)
+                logger.log_file_copy(
+                    change["old_path"],
+                    filepath,
+                    f"파일 복사: {commit_message}",
+                    similarity=change["similarity"]
+                )
+                changes_logged = True
+                print(f"  [복사] {change['old_path']} -> {filepath}")
+
+            if status in 'RC' and change["unstaged"]:
+                # 이동/복사한 뒤 작업 트리에서 더 고친 내용
+                logger.log_file_modification(
+                    filepath,
+                    "이전 버전 (git diff 참조)",
+                    "새 버전 (git diff 참조)",
+                    f"파일 수정: {commit_message}",
+                    diff=file_diffs.get(filepath)
+                )
+                print(f"  [수정] {filepath}")
+
         except Exception as e:
             print(f"  경고: {filepath} 처리 중 오류: {e}")
             continue
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+제외 규칙 매처 벤치마크
+패턴별 정규식을 하나씩 검사하는 방식과 하나로 합친 정규식을 비교
+
+사용법:
+  python3 bench_ignore_matcher.py [경로 개수]
+"""
+
+import random
+import re
+import sys
+import time
+
+from changelog_ignore import (
+    DEFAULT_PATTERNS, IgnoreMatcher, parse_patterns, translate_pattern
+)
+
+
+FLUTTER_PATTERNS = parse_patterns("""
+.dart_tool/
+.flutter-plugins
+.flutter-plugins-dependencies
+android/.gradle/
+ios/Pods/
+ios/Flutter/ephemeral/
+macos/Flutter/ephemeral/
+**/generated_plugin_registrant.*
+**/GeneratedPluginRegistrant.*
+.idea/
+*.iml
+!build/keep.txt
+""".splitlines())
+
+DIRS = [
+    "lib", "lib/models", "lib/screens", "lib/services", "test", "build/app/outputs",
+    "rebuild/tools", ".dart_tool/package_config", "android/app/src/main/kotlin",
+    "android/.gradle/8.0", "ios/Runner", "ios/Pods/Firebase", "linux/flutter",
+    "macos/Flutter/ephemeral", "web/icons", "tools/__pycache__", "node_modules/marked",
+]
+NAMES = [
+    "main.dart", "home_screen.dart", "widget_test.dart", "MainActivity.kt",
+    "AppDelegate.swift", "generated_plugin_registrant.cc", "app.iml", "index.html",
+    "tracker.cpython-311.pyc", "keep.txt", "README.md",
+]
+
+
+class NaiveMatcher:
+    """비교용: 패턴마다 정규식을 따로 검사 (마지막 일치 규칙 적용)"""
+
+    def __init__(self, patterns):
+        self.rules = []
+        for pattern in patterns:
+            negate = pattern.startswith("!")
+            self.rules.append((negate, re.compile(translate_pattern(pattern.lstrip("!")))))
+
+    def match(self, path):
+        ignored = False
+        for negate, regex in self.rules:
+            if regex.fullmatch(path):
+                ignored = not negate
+        return ignored
+
+
+def make_paths(count):
+    rng = random.Random(0)
+    return [f"{rng.choice(DIRS)}/{rng.choice(NAMES)}" for _ in range(count)]
+
+
+def bench(label, matcher, paths):
+    start = time.perf_counter()
+    ignored = sum(1 for path in paths if matcher.match(path))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {elapsed:7.3f}s  ({len(paths) / elapsed:,.0f} paths/s, 제외 {ignored:,}개)")
+    return elapsed, ignored
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    patterns = DEFAULT_PATTERNS + FLUTTER_PATTERNS
+    paths = make_paths(count)
+
+    print(f"경로 {count:,}개, 규칙 {len(patterns)}개")
+    naive, naive_ignored = bench("패턴별 검사", NaiveMatcher(patterns), paths)
+    combined, combined_ignored = bench("합친 정규식", IgnoreMatcher(patterns), paths)
+    assert naive_ignored == combined_ignored
+    print(f"  속도 향상: {naive / combined:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
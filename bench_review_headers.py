@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+리뷰 헤더 파싱 벤치마크
+전체 파일을 문자열로 읽어 파싱하는 방식과 mmap으로 헤더만 읽는 방식,
+그리고 목록 재생성이 실제로 쓰는 load_review_meta를 비교
+
+사용법:
+  python3 bench_review_headers.py [리뷰 개수] [리뷰당 변경 개수]
+"""
+
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from code_changelog_tracker import (
+    CodeChangeLogger, FRONT_MATTER_END, load_review_meta, read_review_header
+)
+
+
+def make_reviews(root, count, changes_per_review):
+    """
+    합성 리뷰 생성 (옆 폴더에 리뷰 하나를 저장한 뒤 복사)
+
+    legacy/에는 front matter와 .meta.json이 없는 이전 형식(헤더 끝 표시까지 훑어야 함),
+    current/에는 지금 형식(front matter + .meta.json 사이드카)으로 만든다.
+
+    Returns:
+        (legacy 폴더, current 폴더, 이전 형식 파일 크기)
+    """
+    logger = CodeChangeLogger(
+        "Benchmark - 헤더 파싱",
+        user_request="mmap 헤더 파싱 벤치마크",
+        reviews_dir=Path(root) / "template"
+    )
+    for idx in range(changes_per_review):
+        logger.log_file_modification(
+            f"lib/module_{idx}.dart",
+            "old line\n" * 30,
+            "new line\n" * 30,
+            "벤치마크용 변경"
+        )
+    review = logger._write_review(logger.changes)
+    data = review.read_bytes()
+    meta = review.with_suffix(".meta.json").read_bytes()
+
+    # front matter와 그 뒤의 빈 줄을 떼어 이전 형식으로
+    end = data.find(FRONT_MATTER_END)
+    legacy = data[end + len(FRONT_MATTER_END):].lstrip(b"\n")
+
+    legacy_dir = Path(root) / "legacy"
+    current_dir = Path(root) / "current"
+    legacy_dir.mkdir()
+    current_dir.mkdir()
+    for idx in range(count):
+        name = f"20250101_{idx:06d}"
+        (legacy_dir / f"{name}.md").write_bytes(legacy)
+        (current_dir / f"{name}.md").write_bytes(data)
+        (current_dir / f"{name}.meta.json").write_bytes(meta)
+    shutil.rmtree(review.parent)
+    return legacy_dir, current_dir, len(legacy)
+
+
+def parse_full(path):
+    """기존 방식: 파일 전체를 읽어 디코딩한 뒤 파싱"""
+    text = Path(path).read_text(encoding="utf-8")
+    title = re.search(r"^# (.*)$", text, re.MULTILINE)
+    created = re.search(r"^\*\*생성 시간\*\*: (.*)$", text, re.MULTILINE)
+    counts = re.findall(r"^- (파일 생성|파일 수정|파일 삭제): (\d+)개$", text, re.MULTILINE)
+    return title, created, counts
+
+
+def bench(label, func, files):
+    start = time.perf_counter()
+    for path in files:
+        func(path)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed:8.3f}s  ({len(files) / elapsed:,.0f} files/s)")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    changes_per_review = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir, current_dir, size = make_reviews(tmp, count, changes_per_review)
+        legacy_files = sorted(legacy_dir.glob("*.md"))
+        current_files = sorted(current_dir.glob("*.md"))
+
+        print(f"리뷰 {count}개, 파일당 {size / 1024:.1f} KiB")
+        print("이전 형식 (front matter 없음, 헤더 끝 표시까지 훑음):")
+        full = bench("전체 읽기", parse_full, legacy_files)
+        header = bench("mmap 헤더", read_review_header, legacy_files)
+        legacy_meta = bench("load_review_meta", load_review_meta, legacy_files)
+        print(f"  속도 향상: {full / header:.1f}x (mmap), {full / legacy_meta:.1f}x (load_review_meta)")
+
+        print("지금 형식 (.meta.json 사이드카):")
+        current_meta = bench("load_review_meta", load_review_meta, current_files)
+        print(f"  속도 향상: {full / current_meta:.1f}x (전체 읽기 대비)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Changelog 정적 사이트 내보내기
+reviews 폴더를 Python 서버 없이 올릴 수 있는 정적 번들로 만든다
+(렌더링된 HTML, 목록/검색 JSON 샤드, .gz/.br 미리 압축본)
+"""
+
+import gzip
+import html
+import json
+import re
+import shutil
+from pathlib import Path
+
+from code_changelog_tracker import CodeChangeLogger
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 .br 압축본은 만들지 않음
+    brotli = None
+
+
+# 목록 샤드 하나에 담을 리뷰 수
+LISTING_SHARD_SIZE = 500
+# 미리 압축해 둘 파일 확장자 (.json.gz 사이드카는 이미 압축되어 있음)
+COMPRESSIBLE_SUFFIXES = {".html", ".md", ".json", ".css", ".js", ".txt"}
+# 검색 토큰 (영문/숫자/한글 단어, 2글자 이상)
+TOKEN_PATTERN = re.compile(r"\w{2,}")
+# 번들에 쓴 파일 목록 (다음 내보내기에서 이 목록에 있는 파일만 정리)
+EXPORT_MANIFEST = ".export-manifest.json"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans KR', sans-serif;
+            background: #0d1117;
+            color: #c9d1d9;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 40px;
+            line-height: 1.7;
+        }}
+        h1 {{ color: #f0f6fc; border-bottom: 1px solid #30363d; padding-bottom: 10px; }}
+        h2 {{ color: #58a6ff; }}
+        h3 {{ color: #79c0ff; }}
+        a {{ color: #58a6ff; text-decoration: none; }}
+        strong {{ color: #f0f6fc; }}
+        code {{ background: #161b22; padding: 3px 6px; border-radius: 3px; color: #ff7b72; }}
+        pre {{ background: #161b22; padding: 16px; border-radius: 6px; border: 1px solid #30363d; overflow-x: auto; }}
+        pre code {{ background: none; padding: 0; color: #c9d1d9; }}
+    </style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def _render_inline(text):
+    """인라인 마크다운 (**굵게**, `코드`, [링크](주소)) -> HTML"""
+    parts = re.split(r"(`[^`]*`)", text)
+    out = []
+    for part in parts:
+        if len(part) >= 2 and part.startswith("`") and part.endswith("`"):
+            out.append(f"<code>{html.escape(part[1:-1])}</code>")
+            continue
+
+        part = html.escape(part, quote=False)
+        part = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", part)
+
+        def link(match):
+            href = match.group(2)
+            # 정적 번들 안에서는 리뷰 문서 대신 렌더링된 HTML로 연결 (상대 경로만)
+            if href.endswith(".md") and not re.match(r"^[a-z][a-z0-9+.-]*:|/", href):
+                href = href[:-3] + ".html"
+            # href는 이미 이스케이프된 텍스트에서 꺼냈으므로 따옴표만 더 이스케이프
+            href = href.replace('"', "&quot;")
+            return f'<a href="{href}">{match.group(1)}</a>'
+
+        out.append(re.sub(r"\[([^\]]*)\]\(([^)\s]*)\)", link, part))
+    return "".join(out)
+
+
+def render_markdown_html(text):
+    """
+    리뷰 문서에 쓰이는 마크다운(제목, 목록, 코드 블록, 문단)을 HTML로 변환
+
+    front matter는 건너뛴다. 일반 마크다운 전체를 지원하지는 않는다.
+    """
+    if text.startswith("---\n"):
+        end = text.find("\n---\n", 3)
+        if end != -1:
+            text = text[end + len("\n---\n"):]
+
+    out = []
+    paragraph = []
+    in_list = False
+    code = None
+
+    def flush():
+        nonlocal in_list
+        if paragraph:
+            out.append("<p>" + "<br>\n".join(_render_inline(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+        if in_list:
+            out.append("</ul>")
+            in_list = False
+
+    for line in text.split("\n"):
+        if code is not None:
+            if line.startswith("```"):
+                out.append("<pre><code>" + html.escape("\n".join(code)) + "</code></pre>")
+                code = None
+            else:
+                code.append(line)
+            continue
+
+        if line.startswith("```"):
+            flush()
+            code = []
+        elif not line.strip():
+            flush()
+        elif line.startswith("#"):
+            flush()
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 6 and line[level:level + 1] == " ":
+                out.append(f"<h{level}>{_render_inline(line[level + 1:].strip())}</h{level}>")
+            else:
+                paragraph.append(line)
+        elif line.startswith("- "):
+            if paragraph:
+                flush()
+            if not in_list:
+                out.append("<ul>")
+                in_list = True
+            out.append(f"<li>{_render_inline(line[2:])}</li>")
+        else:
+            if in_list:
+                flush()
+            paragraph.append(line)
+
+    if code is not None:
+        out.append("<pre><code>" + html.escape("\n".join(code)) + "</code></pre>")
+    flush()
+    return "\n".join(out)
+
+
+def _is_fresh(dest, src):
+    """dest가 src보다 나중에 만들어졌으면 True (다시 만들 필요 없음)"""
+    try:
+        return dest.stat().st_mtime_ns >= src.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _write_if_changed(path, data):
+    """내용이 달라졌을 때만 파일을 씀 (바뀌지 않은 파일의 mtime을 유지)"""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _json_bytes(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _search_tokens(meta):
+    """리뷰 하나의 검색 토큰 (프로젝트, 요구사항, 파일 경로의 단어)"""
+    text = " ".join([meta.get("project", ""), meta.get("request", "")] + meta.get("files", []))
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def _search_shard_name(token):
+    """토큰이 들어갈 검색 샤드 파일명 (첫 글자의 코드포인트, JS에서도 같은 방식으로 계산)"""
+    return f"{ord(token[0]):x}.json"
+
+
+def _compress_variants(path):
+    """path의 .gz(/.br) 압축본을 원본보다 오래되었거나 없을 때만 다시 만듦"""
+    variants = [(path.with_name(path.name + ".gz"), lambda data: gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        variants.append((path.with_name(path.name + ".br"), brotli.compress))
+
+    updated = 0
+    data = None
+    for variant, compress in variants:
+        if _is_fresh(variant, path):
+            continue
+        if data is None:
+            data = path.read_bytes()
+        variant.write_bytes(compress(data))
+        updated += 1
+    return updated
+
+
+def export_site(reviews_dir="reviews", output_dir="site"):
+    """
+    reviews 폴더를 정적 사이트 번들로 내보내기
+
+    입력이 바뀐 산출물만 다시 쓴다. 복사본과 리뷰 HTML은 원본보다 새로우면 건너뛰고,
+    목록/검색 샤드는 내용이 같으면 건드리지 않으며, 압축본은 원본이 바뀐 것만 갱신한다.
+    reviews에서 사라진 리뷰의 산출물은 번들에서도 지운다. 지우는 대상은 이전 내보내기가
+    .export-manifest.json에 남긴 파일뿐이라 번들 폴더의 다른 파일은 건드리지 않는다.
+
+    Returns:
+        {"written": 새로 쓴 파일 수, "compressed": 갱신한 압축본 수, "removed": 지운 파일 수}
+
+    Raises:
+        ValueError: output_dir가 내보내기 기록 없이 비어 있지 않은 폴더일 때
+    """
+    reviews_dir = Path(reviews_dir)
+    out = Path(output_dir)
+    manifest_path = out / EXPORT_MANIFEST
+
+    # 다른 용도의 폴더(웹 루트, 현재 폴더 등)를 번들로 덮어쓰지 않음
+    try:
+        previous = set(json.loads(manifest_path.read_text(encoding="utf-8"))["files"])
+    except FileNotFoundError:
+        if out.is_dir() and any(out.iterdir()):
+            raise ValueError(
+                f"{out}는 비어 있지 않고 내보내기 기록({EXPORT_MANIFEST})이 없습니다. "
+                "빈 폴더나 새 폴더를 지정하세요."
+            ) from None
+        previous = set()
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"{manifest_path}를 읽을 수 없습니다. 빈 폴더에 다시 내보내세요.") from None
+    out.mkdir(parents=True, exist_ok=True)
+
+    logger = CodeChangeLogger("Export", reviews_dir=reviews_dir)
+    reviews = logger._list_reviews()
+
+    expected = set()
+    written = 0
+
+    # 1. reviews 폴더 미러링 (뷰어, 문서, 목차, 메타데이터, 전체 내용 사이드카)
+    for src in reviews_dir.rglob("*"):
+        rel = src.relative_to(reviews_dir)
+        if src.is_dir() or any(part.startswith(".") for part in rel.parts):
+            continue
+        expected.add(rel)
+        dest = out / rel
+        if _is_fresh(dest, src):
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest)
+        written += 1
+
+    # 2. 문서별 렌더링된 HTML (JS 없이 읽을 수 있는 페이지, 프로젝트 샤드 안의 문서 포함)
+    for src in reviews_dir.rglob("*.md"):
+        rel = src.relative_to(reviews_dir).with_suffix(".html")
+        if any(part.startswith(".") for part in rel.parts):
+            continue
+        expected.add(rel)
+        dest = out / rel
+        if _is_fresh(dest, src):
+            continue
+        body = render_markdown_html(src.read_text(encoding="utf-8"))
+        dest.write_text(PAGE_TEMPLATE.format(title=html.escape(src.stem), body=body), encoding="utf-8")
+        written += 1
+
+    # 3. 목록 샤드 (최신순, 파일 목록 제외)
+    shards = []
+    for start in range(0, len(reviews), LISTING_SHARD_SIZE):
+        entries = [
+            {key: value for key, value in meta.items() if key != "files"}
+            for meta in reviews[start:start + LISTING_SHARD_SIZE]
+        ]
+        rel = Path("listing") / f"{len(shards):04d}.json"
+        shards.append(rel.name)
+        expected.add(rel)
+        written += _write_if_changed(out / rel, _json_bytes(entries))
+
+    rel = Path("listing") / "index.json"
+    expected.add(rel)
+    written += _write_if_changed(out / rel, _json_bytes({
+        "total": len(reviews),
+        "shard_size": LISTING_SHARD_SIZE,
+        "shards": shards,
+    }))
+
+    # 4. 검색 샤드 (토큰 첫 글자별: 토큰 -> 리뷰 파일 목록)
+    search = {}
+    for meta in reviews:
+        for token in _search_tokens(meta):
+            shard = search.setdefault(_search_shard_name(token), {})
+            shard.setdefault(token, []).append(meta["file"])
+
+    for name, tokens in search.items():
+        rel = Path("search") / name
+        expected.add(rel)
+        written += _write_if_changed(out / rel, _json_bytes(tokens))
+
+    # 5. 미리 압축본 (nginx gzip_static / brotli_static 등에서 그대로 사용)
+    compressed = 0
+    for rel in expected:
+        if rel.suffix in COMPRESSIBLE_SUFFIXES:
+            compressed += _compress_variants(out / rel)
+
+    produced = {rel.as_posix() for rel in expected}
+    for rel in expected:
+        for suffix in (".gz", ".br"):
+            variant = rel.with_name(rel.name + suffix)
+            if (out / variant).exists():
+                produced.add(variant.as_posix())
+
+    # 6. 이전 내보내기가 썼지만 이번에는 없는 산출물 정리 (비게 된 폴더도)
+    removed = 0
+    for rel in sorted(previous - produced):
+        path = out / rel
+        if ".." in Path(rel).parts or not path.is_file():
+            continue
+        path.unlink()
+        removed += 1
+        for parent in path.parents:
+            if parent == out or any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+    _write_if_changed(manifest_path, _json_bytes({"files": sorted(produced)}))
+    return {"written": written, "compressed": compressed, "removed": removed}
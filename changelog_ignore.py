@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Changelog 제외 규칙
+.changelogignore 파일의 gitignore 형식 패턴을 정규식 하나로 컴파일해서 경로를 판별
+"""
+
+import re
+from pathlib import Path
+
+
+IGNORE_FILE = ".changelogignore"
+
+# 설정 파일이 없어도 항상 적용되는 기본 규칙
+DEFAULT_PATTERNS = [
+    "/reviews/",
+    ".git/",
+    "__pycache__/",
+    "*.pyc",
+    "build/",
+    "node_modules/",
+]
+
+
+def translate_pattern(pattern):
+    """
+    gitignore 패턴 하나를 정규식 문자열로 변환
+
+    - 끝이 /이면 디렉토리만 (그 아래 파일들이 대상)
+    - 중간이나 앞에 /가 있으면 루트 기준, 없으면 어느 깊이에서든 일치
+    - * ? [...] 는 / 를 넘지 않고, ** 는 여러 단계 디렉토리와 일치
+    """
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            chars = pattern[i + 1:end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            out.append(f"[{chars}]")
+            i = end + 1
+        elif c == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    suffix = "/.*" if dir_only else "(?:/.*)?"
+    return prefix + "".join(out) + suffix
+
+
+def parse_patterns(lines):
+    """ignore 파일의 줄들에서 패턴만 추출 (빈 줄, # 주석 제외)"""
+    patterns = []
+    for line in lines:
+        line = line.rstrip("\n\r")
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        patterns.append(line)
+    return patterns
+
+
+class IgnoreMatcher:
+    """
+    gitignore 형식 패턴 목록을 하나로 합친 매처
+
+    모든 패턴을 역순으로 이어 붙인 정규식 하나로 컴파일하므로
+    경로 하나를 판별할 때 정규식 매칭은 한 번만 일어난다.
+    gitignore처럼 마지막으로 일치한 규칙이 적용되고, !패턴은 다시 포함시킨다.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+
+        groups = []
+        for idx in reversed(range(len(self.patterns))):
+            pattern = self.patterns[idx]
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+            elif pattern.startswith("\\!") or pattern.startswith("\\#"):
+                pattern = pattern[1:]
+            # 그룹 이름 첫 글자: i = 제외, n = 다시 포함
+            name = f"{'n' if negate else 'i'}{idx}"
+            groups.append(f"(?P<{name}>{translate_pattern(pattern)})")
+
+        self._regex = re.compile("|".join(groups)) if groups else None
+
+    def match(self, path):
+        """경로(저장소 루트 기준, / 구분)가 제외 대상이면 True"""
+        if self._regex is None:
+            return False
+        m = self._regex.fullmatch(path)
+        return m is not None and m.lastgroup[0] == "i"
+
+
+def load_ignore_matcher(root="."):
+    """기본 규칙 + <root>/.changelogignore 규칙으로 매처 생성"""
+    patterns = list(DEFAULT_PATTERNS)
+    ignore_path = Path(root) / IGNORE_FILE
+    if ignore_path.exists():
+        patterns += parse_patterns(ignore_path.read_text(encoding="utf-8").splitlines())
+    return IgnoreMatcher(patterns)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Changelog 보관 정책
+오래되었거나 용량을 넘는 리뷰를 지우거나 보관 폴더로 옮기고 색인을 부분 갱신
+"""
+
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from code_changelog_tracker import CodeChangeLogger
+
+
+def review_paths(reviews_dir, filename):
+    """리뷰 하나에 딸린 파일들 (문서, 메타데이터, 목차, 전체 내용 폴더) 중 존재하는 것"""
+    path = reviews_dir / filename
+    stem = path.stem
+    candidates = [
+        path,
+        path.with_name(f"{stem}.meta.json"),
+        path.with_name(f"{stem}.toc.json"),
+        path.with_name(stem),
+    ]
+    return [path for path in candidates if path.exists()]
+
+
+def review_size(reviews_dir, filename):
+    """리뷰 하나가 차지하는 바이트 수 (딸린 파일 포함)"""
+    total = 0
+    for path in review_paths(reviews_dir, filename):
+        if path.is_dir():
+            total += sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        else:
+            total += path.stat().st_size
+    return total
+
+
+def storage_project(filename):
+    """
+    리뷰가 저장된 프로젝트 (keep_last의 묶음 기준)
+
+    reviews/<프로젝트>/<yyyy>/<mm>/ 샤드의 리뷰는 경로 첫 부분,
+    reviews 바로 아래에 쌓인 리뷰는 모두 한 묶음("")으로 본다.
+    리뷰마다 달라질 수 있는 표시용 제목(meta["project"])은 쓰지 않는다.
+    """
+    parts = Path(filename).parts
+    return parts[0] if len(parts) > 1 else ""
+
+
+def select_expired(reviews, sizes=None, now=None, max_age_days=None, max_bytes=None, keep_last=None):
+    """
+    보관 규칙에 걸리는 리뷰 선택
+
+    Args:
+        reviews: 최신순 리뷰 메타데이터 목록 (manifest.json의 reviews)
+        sizes: 파일명 -> 바이트 수 (max_bytes를 쓸 때 필요)
+        now: 기준 시각 (기본: 현재)
+        max_age_days: 이 일수보다 오래된 리뷰 만료
+        max_bytes: 남은 리뷰 전체 크기가 이 값을 넘으면 오래된 것부터 만료
+        keep_last: 저장 프로젝트(storage_project)별로 최신 N개만 유지
+
+    Returns:
+        만료된 리뷰 파일명 목록 (오래된 순)
+    """
+    now = now or datetime.now()
+    expired = set()
+
+    if keep_last is not None:
+        per_project = {}
+        for meta in reviews:
+            project = storage_project(meta["file"])
+            count = per_project.get(project, 0)
+            if count >= keep_last:
+                expired.add(meta["file"])
+            per_project[project] = count + 1
+
+    if max_age_days is not None:
+        cutoff = now - timedelta(days=max_age_days)
+        for meta in reviews:
+            try:
+                created = datetime.strptime(meta.get("name", ""), "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                continue
+            if created < cutoff:
+                expired.add(meta["file"])
+
+    if max_bytes is not None:
+        total = sum(sizes[meta["file"]] for meta in reviews if meta["file"] not in expired)
+        for meta in reversed(reviews):
+            if total <= max_bytes:
+                break
+            if meta["file"] not in expired:
+                expired.add(meta["file"])
+                total -= sizes[meta["file"]]
+
+    return [meta["file"] for meta in reversed(reviews) if meta["file"] in expired]
+
+
+def apply_retention(reviews_dir="reviews", archive_dir=None, dry_run=False, **rules):
+    """
+    보관 규칙을 적용해 만료된 리뷰를 지우거나 archive_dir로 옮김
+
+    manifest.json/views.json에서는 지운 리뷰만 빼고(프로젝트 샤드의 리뷰면 샤드와
+    프로젝트 색인에서도), SUMMARY.md와 index.html은 색인으로 다시 쓴다. reviews 폴더 전체를 다시 훑지 않으므로 cron이나
+    post-commit hook에서 자주 돌려도 부담이 적다.
+
+    Args:
+        reviews_dir: 리뷰 폴더
+        archive_dir: 지정하면 삭제 대신 이 폴더로 이동 (reviews 폴더 안의 경로 유지)
+        dry_run: True면 대상만 계산하고 아무것도 바꾸지 않음
+        **rules: select_expired의 max_age_days, max_bytes, keep_last
+
+    Returns:
+        만료된 리뷰 파일명 목록
+    """
+    reviews_dir = Path(reviews_dir)
+    logger = CodeChangeLogger("Retention", reviews_dir=reviews_dir)
+    reviews = logger._list_reviews()
+
+    sizes = None
+    if rules.get("max_bytes") is not None:
+        sizes = {meta["file"]: review_size(reviews_dir, meta["file"]) for meta in reviews}
+
+    expired = select_expired(reviews, sizes=sizes, **rules)
+    if dry_run or not expired:
+        return expired
+
+    if archive_dir is not None:
+        archive_dir = Path(archive_dir)
+
+    for filename in expired:
+        for path in review_paths(reviews_dir, filename):
+            if archive_dir is not None:
+                dest = archive_dir / path.relative_to(reviews_dir)
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(path), str(dest))
+            elif path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+    logger._remove_from_index(expired)
+    with logger._index_lock():
+        logger._update_summary()
+        logger._update_index_html()
+        for project in sorted({Path(filename).parts[0] for filename in expired if len(Path(filename).parts) > 1}):
+            logger._update_summary(reviews_dir / project)
+            logger._update_index_html(reviews_dir / project)
+    return expired
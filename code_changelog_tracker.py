@@ -5,28 +5,165 @@ AI가 생성한 모든 코드 변경사항을 reviews 폴더에 기록하고 HTM
 """
 
 import os
+import re
 import glob
+import gzip
+import json
+import mmap
+import shutil
+import http.server
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: 색인 잠금 없이 동작
+    fcntl = None
+
+
+# 리뷰 문서 앞머리 (key: JSON 값 형태의 YAML front matter)
+FRONT_MATTER_START = b"---\n"
+FRONT_MATTER_END = b"\n---\n"
+
+# 리뷰 문서 헤더의 끝 표시 (이 앞부분만 읽어서 목록/요약을 만든다)
+HEADER_END_MARKER = "\n## 상세 변경사항".encode("utf-8")
+HEADER_COUNT_LABELS = {
+    "파일 생성": "creation",
+    "파일 수정": "modification",
+    "파일 삭제": "deletion",
+    "파일 이동": "rename",
+    "파일 복사": "copy",
+}
+HEADER_COUNT_PATTERN = re.compile(r"^- (파일 생성|파일 수정|파일 삭제|파일 이동|파일 복사): (\d+)개$")
+
+# 멀티 프로젝트 레이아웃의 월별 샤드 폴더 (reviews/<프로젝트>/<yyyy>/<mm>/)
+SHARD_YEAR_PATTERN = re.compile(r"^\d{4}$")
+SHARD_MONTH_PATTERN = re.compile(r"^\d{2}$")
+
+
+def _parse_front_matter(text, header):
+    """front matter의 key: JSON 값 줄들을 header 딕셔너리에 채움"""
+    for line in text.split("\n"):
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        try:
+            header[key.strip()] = json.loads(value)
+        except ValueError:
+            header[key.strip()] = value.strip()
+    return header
+
+
+def read_review_header(path):
+    """
+    리뷰 마크다운의 헤더(프로젝트, 생성 시간, 변경 개수)만 파싱
+
+    파일을 mmap으로 열어 front matter(없으면 헤더 끝 표시)까지만
+    디코딩하므로 본문 크기와 상관없이 헤더 길이만큼만 메모리를 사용한다.
+
+    Returns:
+        {"project": str, "created": str, "counts": dict, ...}
+        (헤더가 없는 파일이면 빈 값)
+    """
+    header = {"project": "", "created": "", "counts": {}}
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return header
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(FRONT_MATTER_START)] == FRONT_MATTER_START:
+                end = mm.find(FRONT_MATTER_END, len(FRONT_MATTER_START) - 1)
+                if end != -1:
+                    text = mm[len(FRONT_MATTER_START):end].decode("utf-8", errors="replace")
+                    return _parse_front_matter(text, header)
+
+            end = mm.find(HEADER_END_MARKER)
+            if end == -1:
+                end = len(mm)
+            text = mm[:end].decode("utf-8", errors="replace")
+
+    # front matter가 없는 이전 형식의 리뷰
+    for line in text.split("\n"):
+        line = line.rstrip("\r")
+        if not header["project"] and line.startswith("# "):
+            header["project"] = line[2:].strip()
+        elif line.startswith("**생성 시간**:"):
+            header["created"] = line.split(":", 1)[1].strip()
+        else:
+            match = HEADER_COUNT_PATTERN.match(line)
+            if match:
+                header["counts"][HEADER_COUNT_LABELS[match.group(1)]] = int(match.group(2))
+
+    return header
+
+
+def load_review_meta(path):
+    """
+    리뷰 메타데이터 로드
+
+    <timestamp>.meta.json 사이드카가 있으면 그것만 읽고,
+    없으면(이전 형식) 마크다운 헤더를 파싱한다.
+    """
+    path = Path(path)
+    meta_path = path.with_suffix(".meta.json")
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        meta = read_review_header(path)
+    meta["file"] = path.name
+    return meta
+
 
 class CodeChangeLogger:
     """코드 변경사항을 추적하고 문서화하는 로거"""
 
-    def __init__(self, project_name, user_request="", reviews_dir="reviews", port=4000):
+    # 마크다운에 미리보기로 남길 내용 길이 (변경 유형 -> 필드 -> 글자 수)
+    PREVIEW_LIMITS = {
+        "creation": {"content": 500},
+        "modification": {"old_content": 300, "new_content": 300, "diff": 300},
+    }
+    CONTENT_FIELDS = ("content", "old_content", "new_content", "diff")
+    CHANGE_TYPES = ("creation", "modification", "deletion", "bug_fix", "refactoring", "rename", "copy")
+    # log_changes로 받는 레코드의 변경 유형별 필수 필드
+    REQUIRED_FIELDS = {
+        "creation": ("file_path", "content", "reason"),
+        "modification": ("file_path", "old_content", "new_content", "reason"),
+        "deletion": ("file_path", "content", "reason"),
+        "bug_fix": ("file_path", "old_content", "new_content", "bug_desc", "fix_desc"),
+        "refactoring": ("file_path", "old_content", "new_content", "refactor_type", "reason"),
+        "rename": ("file_path", "old_path", "reason"),
+        "copy": ("file_path", "old_path", "reason"),
+    }
+
+    def __init__(self, project_name, user_request="", reviews_dir="reviews", port=4000, project=None):
         """
         Args:
             project_name: 프로젝트 이름
             user_request: 사용자 요구사항
             reviews_dir: 문서 저장 디렉토리
             port: HTTP 서버 포트
+            project: 프로젝트 폴더 이름. 지정하면 여러 프로젝트가 함께 쓰는 reviews
+                폴더에 reviews/<project>/<yyyy>/<mm>/ 로 나눠 저장 (기본: reviews 바로 아래)
         """
+        if project is not None and (not project or project.startswith(".") or Path(project).name != project):
+            raise ValueError(f"프로젝트 폴더 이름으로 쓸 수 없습니다: {project!r}")
+
         self.project_name = project_name
         self.user_request = user_request
         self.reviews_dir = Path(reviews_dir)
         self.port = port
+        self.project = project
         self.changes = []
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._lock_depth = 0
+
+        # 이번 리뷰를 저장할 폴더 (멀티 프로젝트면 프로젝트의 월별 샤드)
+        if project is None:
+            self.review_dir = self.reviews_dir
+        else:
+            self.review_dir = self.reviews_dir / project / self.timestamp[:4] / self.timestamp[4:6]
 
         # reviews 폴더 생성
         self.reviews_dir.mkdir(exist_ok=True)
@@ -40,15 +177,18 @@ class CodeChangeLogger:
             "reason": reason
         })
 
-    def log_file_modification(self, file_path, old_content, new_content, reason):
-        """파일 수정 기록"""
-        self.changes.append({
+    def log_file_modification(self, file_path, old_content, new_content, reason, diff=None):
+        """파일 수정 기록 (diff: 있으면 unified diff도 함께 기록)"""
+        change = {
             "type": "modification",
             "file_path": file_path,
             "old_content": old_content,
             "new_content": new_content,
             "reason": reason
-        })
+        }
+        if diff:
+            change["diff"] = diff
+        self.changes.append(change)
 
     def log_file_deletion(self, file_path, content, reason):
         """파일 삭제 기록"""
@@ -81,14 +221,138 @@ class CodeChangeLogger:
             "reason": reason
         })
 
-    def _generate_markdown(self):
-        """변경사항을 마크다운 형식으로 생성"""
+    def log_file_rename(self, old_path, new_path, reason, similarity=100):
+        """파일 이름 변경(이동) 기록 - 내용은 담지 않음"""
+        self.changes.append({
+            "type": "rename",
+            "file_path": new_path,
+            "old_path": old_path,
+            "similarity": similarity,
+            "reason": reason
+        })
+
+    def log_file_copy(self, source_path, new_path, reason, similarity=100):
+        """파일 복사 기록 - 내용은 담지 않음"""
+        self.changes.append({
+            "type": "copy",
+            "file_path": new_path,
+            "old_path": source_path,
+            "similarity": similarity,
+            "reason": reason
+        })
+
+    def log_changes(self, records, batch_size=1000):
+        """
+        변경사항 레코드들을 한 번에 기록 (대량 기록용)
+
+        레코드는 log_file_* 메서드가 만드는 것과 같은 딕셔너리
+        ({"type": "creation", "file_path": ..., "content": ..., "reason": ...} 등)이다.
+        batch_size개씩 검증한 뒤 self.changes에 모으지 않고 바로 리뷰 파일로
+        흘려보내므로 제너레이터로 수십만 개를 넘겨도 메모리가 늘지 않는다.
+
+        Args:
+            records: 변경사항 딕셔너리의 이터러블 (리스트, 제너레이터, iter_jsonl 등)
+            batch_size: 한 번에 검증할 레코드 수
+
+        Returns:
+            저장한 마크다운 파일 경로 (레코드가 없으면 None)
+
+        Raises:
+            ValueError: 잘못된 레코드가 있을 때 (만들던 리뷰는 남기지 않음)
+        """
+        filepath = self._write_review(self._validate_records(records, batch_size))
+        if not filepath:
+            print("기록할 변경사항이 없습니다.")
+            return None
+
+        print(f"✅ 변경사항 저장 완료: {filepath}")
+        self._build_outputs()
+        return filepath
+
+    def _validate_records(self, records, batch_size):
+        """레코드를 batch_size개씩 검증하며 그대로 흘려보냄"""
+        records = iter(records)
+        position = 0
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+            batch = [
+                self._validate_record(position + offset, record)
+                for offset, record in enumerate(batch, 1)
+            ]
+            position += len(batch)
+            yield from batch
+
+    def _validate_record(self, number, record):
+        """레코드 하나 검증 (number는 오류 메시지용 순번), 기본값을 채운 사본 반환"""
+        if not isinstance(record, dict):
+            raise ValueError(f"{number}번째 변경사항이 객체가 아닙니다: {record!r}")
+
+        change_type = record.get("type")
+        if change_type not in self.REQUIRED_FIELDS:
+            raise ValueError(f"{number}번째 변경사항의 type을 알 수 없습니다: {change_type!r}")
+
+        for field in self.REQUIRED_FIELDS[change_type]:
+            if not isinstance(record.get(field), str):
+                raise ValueError(f"{number}번째 변경사항({change_type})에 문자열 {field}가 없습니다")
+
+        # 필수가 아니어도 렌더링/사이드카/파일 목록에 쓰이는 필드는 있으면 문자열이어야 함
+        for field in self.CONTENT_FIELDS + ("old_path",):
+            if field in record and not isinstance(record[field], str):
+                raise ValueError(f"{number}번째 변경사항({change_type})의 {field}가 문자열이 아닙니다")
+
+        record = dict(record)
+        if change_type in ("rename", "copy"):
+            similarity = record.setdefault("similarity", 100)
+            if type(similarity) is not int or not 0 <= similarity <= 100:
+                raise ValueError(
+                    f"{number}번째 변경사항({change_type})의 similarity는 0~100 정수여야 합니다: {similarity!r}"
+                )
+        return record
+
+    def _track_change(self, change, counts, files, seen):
+        """변경 유형별 개수와 관련 파일 목록에 변경사항 하나를 반영"""
+        counts[change["type"]] = counts.get(change["type"], 0) + 1
+        # 이름 변경/복사는 이전 경로의 이력에도 남도록 함께 기록
+        for path in (change.get("old_path"), change["file_path"]):
+            if path and path not in seen:
+                seen.add(path)
+                files.append(path)
+
+    def _generate_metadata(self, filename, created, counts, files):
+        """목록/색인용 메타데이터 (본문 없이 리뷰를 설명하는 값들)"""
+        return {
+            "file": filename,
+            "project": self.project_name,
+            "request": self.user_request,
+            "created": created.strftime("%Y-%m-%d %H:%M:%S"),
+            "counts": counts,
+            "files": files,
+        }
+
+    def _render_front_matter(self, meta):
+        """
+        마크다운 앞머리(front matter) 생성
+
+        값은 JSON으로 써서 YAML로도 JSON으로도 읽을 수 있게 한다.
+        파일 목록은 길어질 수 있어 사이드카(.meta.json)에만 둔다.
+        """
+        md_lines = ["---"]
+        for key in ("project", "request", "created", "counts"):
+            md_lines.append(f"{key}: {json.dumps(meta[key], ensure_ascii=False)}")
+        md_lines.append("---")
+        md_lines.append("")
+        return "\n".join(md_lines)
+
+    def _render_header(self, created, counts):
+        """리뷰 문서의 헤더(제목, 요구사항, 변경 요약) 생성"""
         md_lines = []
 
         # 헤더
         md_lines.append(f"# {self.project_name}")
         md_lines.append("")
-        md_lines.append(f"**생성 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        md_lines.append(f"**생성 시간**: {created}")
         md_lines.append("")
 
         if self.user_request:
@@ -100,125 +364,470 @@ class CodeChangeLogger:
         # 변경사항 요약
         md_lines.append("## 변경 요약")
         md_lines.append("")
-        creation_count = sum(1 for c in self.changes if c["type"] == "creation")
-        modification_count = sum(1 for c in self.changes if c["type"] == "modification")
-        deletion_count = sum(1 for c in self.changes if c["type"] == "deletion")
-
-        md_lines.append(f"- 파일 생성: {creation_count}개")
-        md_lines.append(f"- 파일 수정: {modification_count}개")
-        md_lines.append(f"- 파일 삭제: {deletion_count}개")
+        md_lines.append(f"- 파일 생성: {counts.get('creation', 0)}개")
+        md_lines.append(f"- 파일 수정: {counts.get('modification', 0)}개")
+        md_lines.append(f"- 파일 삭제: {counts.get('deletion', 0)}개")
+        if counts.get("rename"):
+            md_lines.append(f"- 파일 이동: {counts['rename']}개")
+        if counts.get("copy"):
+            md_lines.append(f"- 파일 복사: {counts['copy']}개")
         md_lines.append("")
 
         # 상세 변경사항
         md_lines.append("## 상세 변경사항")
         md_lines.append("")
 
-        for idx, change in enumerate(self.changes, 1):
-            change_type = change["type"]
-            file_path = change["file_path"]
+        return "\n".join(md_lines)
+
+    def _render_change(self, idx, change):
+        """변경사항 하나를 마크다운 섹션으로 생성"""
+        md_lines = []
+        change_type = change["type"]
+        file_path = change["file_path"]
+
+        md_lines.append(f"### {idx}. {file_path}")
+        md_lines.append("")
 
-            md_lines.append(f"### {idx}. {file_path}")
+        if change_type == "creation":
+            md_lines.append(f"**작업**: 파일 생성")
+            md_lines.append(f"**이유**: {change['reason']}")
+            md_lines.append("")
+            md_lines.append("```")
+            md_lines.append(self._preview(change, "content"))
+            md_lines.append("```")
             md_lines.append("")
 
-            if change_type == "creation":
-                md_lines.append(f"**작업**: 파일 생성")
-                md_lines.append(f"**이유**: {change['reason']}")
-                md_lines.append("")
-                md_lines.append("```")
-                md_lines.append(change["content"][:500] + ("..." if len(change["content"]) > 500 else ""))
+        elif change_type == "modification":
+            md_lines.append(f"**작업**: 파일 수정")
+            md_lines.append(f"**이유**: {change['reason']}")
+            md_lines.append("")
+            md_lines.append("**변경 전:**")
+            md_lines.append("```")
+            md_lines.append(self._preview(change, "old_content"))
+            md_lines.append("```")
+            md_lines.append("")
+            md_lines.append("**변경 후:**")
+            md_lines.append("```")
+            md_lines.append(self._preview(change, "new_content"))
+            md_lines.append("```")
+            md_lines.append("")
+            if change.get("diff"):
+                md_lines.append("**diff:**")
+                md_lines.append("```diff")
+                md_lines.append(self._preview(change, "diff"))
                 md_lines.append("```")
                 md_lines.append("")
 
-            elif change_type == "modification":
-                md_lines.append(f"**작업**: 파일 수정")
-                md_lines.append(f"**이유**: {change['reason']}")
-                md_lines.append("")
-                md_lines.append("**변경 전:**")
-                md_lines.append("```")
-                md_lines.append(change["old_content"][:300] + ("..." if len(change["old_content"]) > 300 else ""))
-                md_lines.append("```")
-                md_lines.append("")
-                md_lines.append("**변경 후:**")
-                md_lines.append("```")
-                md_lines.append(change["new_content"][:300] + ("..." if len(change["new_content"]) > 300 else ""))
-                md_lines.append("```")
-                md_lines.append("")
+        elif change_type == "deletion":
+            md_lines.append(f"**작업**: 파일 삭제")
+            md_lines.append(f"**이유**: {change['reason']}")
+            md_lines.append("")
 
-            elif change_type == "deletion":
-                md_lines.append(f"**작업**: 파일 삭제")
-                md_lines.append(f"**이유**: {change['reason']}")
-                md_lines.append("")
+        elif change_type == "bug_fix":
+            md_lines.append(f"**작업**: 버그 수정")
+            md_lines.append(f"**버그 설명**: {change['bug_desc']}")
+            md_lines.append(f"**수정 내용**: {change['fix_desc']}")
+            md_lines.append("")
 
-            elif change_type == "bug_fix":
-                md_lines.append(f"**작업**: 버그 수정")
-                md_lines.append(f"**버그 설명**: {change['bug_desc']}")
-                md_lines.append(f"**수정 내용**: {change['fix_desc']}")
-                md_lines.append("")
+        elif change_type == "refactoring":
+            md_lines.append(f"**작업**: 리팩토링 ({change['refactor_type']})")
+            md_lines.append(f"**이유**: {change['reason']}")
+            md_lines.append("")
 
-            elif change_type == "refactoring":
-                md_lines.append(f"**작업**: 리팩토링 ({change['refactor_type']})")
-                md_lines.append(f"**이유**: {change['reason']}")
-                md_lines.append("")
+        elif change_type in ("rename", "copy"):
+            action = "파일 이동" if change_type == "rename" else "파일 복사"
+            if change["similarity"] < 100:
+                action += f" (유사도 {change['similarity']}%)"
+            md_lines.append(f"**작업**: {action}")
+            md_lines.append(f"**원래 경로**: {change['old_path']}")
+            md_lines.append(f"**이유**: {change['reason']}")
+            md_lines.append("")
+
+        if self._needs_content_sidecar(change):
+            md_lines.append(f"[전체 내용 보기]({self._content_sidecar_name(idx)})")
+            md_lines.append("")
 
         return "\n".join(md_lines)
 
-    def _update_summary(self):
-        """SUMMARY.md 업데이트"""
-        summary_path = self.reviews_dir / "SUMMARY.md"
+    def _preview(self, change, field):
+        """마크다운에 표시할 내용 미리보기 (길면 잘라내고 ... 표시)"""
+        text = change[field]
+        limit = self.PREVIEW_LIMITS[change["type"]][field]
+        return text[:limit] + ("..." if len(text) > limit else "")
 
-        # 모든 마크다운 파일 찾기 (README 제외)
-        md_files = sorted(
-            [f for f in self.reviews_dir.glob("*.md")
-             if f.name not in ["README.md", "SUMMARY.md"]],
-            reverse=True  # 최신 파일이 위로
-        )
+    def _needs_content_sidecar(self, change):
+        """
+        마크다운에 다 담기지 않는 내용이 있는지 확인
 
-        summary_lines = ["# 변경 이력", ""]
+        미리보기 한도가 없는 필드(삭제된 파일 내용 등)는 비어 있지 않을 때만 별도 파일로 보관한다.
+        """
+        limits = self.PREVIEW_LIMITS.get(change["type"], {})
+        for field in self.CONTENT_FIELDS:
+            text = change.get(field)
+            if not text:
+                continue
+            if field not in limits or len(text) > limits[field]:
+                return True
+        return False
+
+    def _content_sidecar_name(self, idx):
+        """변경사항 전체 내용 파일의 상대 경로 (리뷰 문서가 있는 폴더 기준)"""
+        return f"{self.timestamp}/{idx}.json.gz"
+
+    def _write_content_sidecar(self, idx, change):
+        """변경사항의 전체 내용을 gzip 압축 JSON으로 별도 저장"""
+        sidecar_path = self.review_dir / self._content_sidecar_name(idx)
+        sidecar_path.parent.mkdir(exist_ok=True)
+
+        payload = {"type": change["type"], "file_path": change["file_path"]}
+        for field in self.CONTENT_FIELDS:
+            if field in change:
+                payload[field] = change[field]
+
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        sidecar_path.write_bytes(gzip.compress(data, mtime=0))
+
+    def _write_review(self, changes):
+        """
+        변경사항들을 리뷰 파일로 스트리밍 저장
 
-        for md_file in md_files:
-            # 타임스탬프 파싱
-            filename = md_file.stem
-            try:
-                dt = datetime.strptime(filename, "%Y%m%d_%H%M%S")
-                display_name = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                display_name = filename
+        섹션을 하나씩 렌더링해 임시 본문 파일에 바로 쓰고(전체 내용 사이드카도
+        이때 저장), 끝나면 개수/파일 목록으로 헤더를 만들어 본문 앞에 붙인다.
+        변경사항을 메모리에 모아두지 않으므로 제너레이터도 그대로 받을 수 있다.
 
-            summary_lines.append(f"- [{display_name}]({md_file.name})")
+        Returns:
+            저장한 마크다운 파일 경로 (변경사항이 없으면 None)
+        """
+        filename = f"{self.timestamp}.md"
+        filepath = self.review_dir / filename
+        body_path = self.review_dir / f".{self.timestamp}.body.tmp"
+        self.review_dir.mkdir(parents=True, exist_ok=True)
+
+        counts = {change_type: 0 for change_type in self.CHANGE_TYPES}
+        files = []
+        seen = set()
+        sections = []
+        offset = 0
+
+        try:
+            with open(body_path, "wb") as body:
+                for idx, change in enumerate(changes, 1):
+                    # 섹션 앞에 구분자 "\n"을 붙여 씀 (목차의 start는 구분자 다음)
+                    data = ("\n" + self._render_change(idx, change)).encode("utf-8")
+                    body.write(data)
+                    sections.append({
+                        "index": idx,
+                        "type": change["type"],
+                        "file_path": change["file_path"],
+                        "start": offset + 1,
+                        "end": offset + len(data),
+                    })
+                    offset += len(data)
+
+                    self._track_change(change, counts, files, seen)
+                    if self._needs_content_sidecar(change):
+                        self._write_content_sidecar(idx, change)
+
+            if not sections:
+                return None
+
+            meta = self._generate_metadata(filename, datetime.now(), counts, files)
+            header = (
+                self._render_front_matter(meta) + "\n" + self._render_header(meta["created"], counts)
+            ).encode("utf-8")
+
+            with open(filepath, "wb") as out, open(body_path, "rb") as body:
+                out.write(header)
+                shutil.copyfileobj(body, out)
+        except BaseException:
+            # 중간에 실패하면 만들던 문서와 사이드카를 남기지 않음
+            filepath.unlink(missing_ok=True)
+            shutil.rmtree(self.review_dir / self.timestamp, ignore_errors=True)
+            raise
+        finally:
+            body_path.unlink(missing_ok=True)
+
+        # 목록/색인용 메타데이터 사이드카
+        self._write_json(f"{self.timestamp}.meta.json", meta, self.review_dir)
+
+        # 섹션 목차 (뷰어가 Range 요청으로 섹션을 나눠 불러옴, end는 미포함)
+        for section in sections:
+            section["start"] += len(header)
+            section["end"] += len(header)
+        toc = {
+            "file": filename,
+            "header": [0, len(header)],
+            "sections": sections,
+            "size": len(header) + offset,
+        }
+        self._write_json(f"{self.timestamp}.toc.json", toc, self.review_dir)
+
+        # 색인과 묶음 보기에 추가
+        self._add_to_index(meta)
+        return filepath
 
-        summary_path.write_text("\n".join(summary_lines), encoding="utf-8")
+    def _scan_reviews(self, level_dir=None):
+        """폴더 바로 아래의 리뷰를 훑어 메타데이터 목록 생성 (최신순, 본문은 읽지 않음)"""
+        level_dir = self.reviews_dir if level_dir is None else level_dir
+        reviews = []
+        for md_file in level_dir.glob("*.md"):
+            if md_file.name in ["README.md", "SUMMARY.md"]:
+                continue
+            meta = load_review_meta(md_file)
+            meta["name"] = self._display_name(md_file, meta)
+            reviews.append(meta)
+
+        reviews.sort(key=lambda meta: (meta["name"], meta["file"]), reverse=True)
+        return reviews
+
+    def _list_reviews(self, level_dir=None):
+        """색인(manifest.json)의 리뷰 목록 (최신순, 없으면 새로 만듦)"""
+        level_dir = self.reviews_dir if level_dir is None else level_dir
+        manifest_path = level_dir / "manifest.json"
+        try:
+            return json.loads(manifest_path.read_text(encoding="utf-8"))["reviews"]
+        except (OSError, ValueError, KeyError):
+            return self._rebuild_index(level_dir)
+
+    def _write_json(self, name, data, level_dir=None):
+        """reviews 폴더(또는 level_dir)에 공백 없는 JSON으로 저장"""
+        path = (self.reviews_dir if level_dir is None else level_dir) / name
+        self._replace_text(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+    def _replace_text(self, path, text):
+        """임시 파일에 쓴 뒤 바꿔치기 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)"""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def _index_lock(self):
+        """
+        색인 갱신 잠금 (reviews/.index.lock에 flock)
 
-    def _update_index_html(self):
-        """index.html 생성 또는 업데이트"""
-        index_path = self.reviews_dir / "index.html"
-
-        # 모든 마크다운 파일 찾기 (최신순)
-        md_files = sorted(
-            [f for f in self.reviews_dir.glob("*.md")
-             if f.name not in ["SUMMARY.md"]],
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        여러 저장소의 hook이 같은 reviews 폴더에 동시에 쓸 때 manifest.json,
+        views.json 등의 읽기-수정-쓰기가 섞이지 않게 한다. 이미 잡고 있으면 다시 잡지 않는다.
+        """
+        lock_file = None
+        if fcntl is not None and not self._lock_depth:
+            lock_file = open(self.reviews_dir / ".index.lock", "a")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if lock_file is not None:
+                lock_file.close()
+
+    def _child_levels(self, level_dir):
+        """
+        level_dir의 색인에 합쳐지는 하위 색인 폴더
+
+        reviews 폴더 -> 프로젝트 폴더(연도 폴더가 있는 폴더), 프로젝트 폴더 -> 월별 샤드
+        """
+        depth = len(level_dir.relative_to(self.reviews_dir).parts)
+        if depth == 0:
+            return sorted(
+                child for child in level_dir.iterdir()
+                if child.is_dir() and not child.name.startswith(".") and any(
+                    year.is_dir() and SHARD_YEAR_PATTERN.match(year.name) for year in child.iterdir()
+                )
+            )
+        if depth == 1:
+            return sorted(
+                month
+                for year in level_dir.iterdir() if year.is_dir() and SHARD_YEAR_PATTERN.match(year.name)
+                for month in year.iterdir() if month.is_dir() and SHARD_MONTH_PATTERN.match(month.name)
+            )
+        return []
+
+    def _index_levels(self, review_dir):
+        """review_dir의 리뷰가 올라가는 색인 폴더들 (월별 샤드, 프로젝트, reviews 폴더 순)"""
+        parts = review_dir.relative_to(self.reviews_dir).parts
+        levels = [review_dir]
+        if len(parts) > 1:
+            levels.append(self.reviews_dir / parts[0])
+        if parts:
+            levels.append(self.reviews_dir)
+        return levels
+
+    def _page_levels(self):
+        """README/SUMMARY.md/index.html을 두는 폴더 (멀티 프로젝트면 프로젝트 폴더도)"""
+        if self.project is None:
+            return [self.reviews_dir]
+        return [self.reviews_dir / self.project, self.reviews_dir]
+
+    def _view_keys(self, meta):
+        """리뷰가 속하는 묶음 보기의 키 (파일별, 유형별, 일별)"""
+        return {
+            "by_file": meta.get("files", []),
+            "by_type": [t for t, count in meta.get("counts", {}).items() if count],
+            "by_day": [meta["name"][:10]],
+        }
+
+    def _build_views(self, reviews):
+        """리뷰 목록으로 파일별/유형별/일별 묶음 보기 생성 (각 목록은 최신순)"""
+        views = {"by_file": {}, "by_type": {}, "by_day": {}}
+        for meta in reviews:
+            for view, keys in self._view_keys(meta).items():
+                for key in keys:
+                    views[view].setdefault(key, []).append(meta["file"])
+        return views
+
+    def _rebuild_index(self, level_dir=None, rescan=None):
+        """
+        manifest.json과 views.json을 다시 생성
 
-        # 파일 목록을 JavaScript 배열로 변환
-        file_list = []
-        for md_file in md_files:
-            filename = md_file.name
-            try:
-                if filename == "README.md":
-                    display_name = "홈"
+        level_dir 바로 아래의 리뷰는 새로 훑고, 하위 색인 폴더(프로젝트, 월별 샤드)의
+        목록은 경로를 앞에 붙여 합친다. rescan(하위 폴더)이 False인 하위 폴더는
+        다시 훑지 않고 기존 manifest.json을 그대로 쓴다 (기본: 모두 다시 훑음).
+        """
+        with self._index_lock():
+            level_dir = self.reviews_dir if level_dir is None else level_dir
+            reviews = self._scan_reviews(level_dir)
+            for child in self._child_levels(level_dir):
+                if rescan is None or rescan(child):
+                    child_reviews = self._rebuild_index(child, rescan)
                 else:
-                    dt = datetime.strptime(md_file.stem, "%Y%m%d_%H%M%S")
-                    display_name = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                display_name = md_file.stem
+                    child_reviews = self._list_reviews(child)
+                prefix = child.relative_to(level_dir).as_posix()
+                reviews.extend(dict(meta, file=f"{prefix}/{meta['file']}") for meta in child_reviews)
+
+            reviews.sort(key=lambda r: (r["name"], r["file"]), reverse=True)
+            self._write_json("manifest.json", {"reviews": reviews}, level_dir)
+            self._write_json("views.json", self._build_views(reviews), level_dir)
+            return reviews
+
+    def _add_to_index(self, meta):
+        """새 리뷰 하나를 샤드부터 reviews 폴더까지 각 색인에 추가 (전체 재생성 없이)"""
+        with self._index_lock():
+            for level_dir in self._index_levels(self.review_dir):
+                prefix = self.review_dir.relative_to(level_dir).as_posix()
+                entry = dict(meta, name=meta["created"])
+                if prefix != ".":
+                    entry["file"] = f"{prefix}/{meta['file']}"
+                self._add_index_entry(level_dir, entry)
+
+    def _add_index_entry(self, level_dir, meta):
+        """level_dir의 manifest.json과 views.json에 리뷰 하나 추가"""
+        reviews = [r for r in self._list_reviews(level_dir) if r["file"] != meta["file"]]
+        reviews.append(meta)
+        reviews.sort(key=lambda r: (r["name"], r["file"]), reverse=True)
+        self._write_json("manifest.json", {"reviews": reviews}, level_dir)
+
+        views_path = level_dir / "views.json"
+        try:
+            views = json.loads(views_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            views = self._build_views(reviews)
+        else:
+            for view, keys in self._view_keys(meta).items():
+                groups = views.setdefault(view, {})
+                for key in keys:
+                    entries = groups.setdefault(key, [])
+                    if meta["file"] not in entries:
+                        entries.insert(0, meta["file"])
+        self._write_json("views.json", views, level_dir)
+
+    def _remove_from_index(self, files):
+        """
+        지운 리뷰들을 각 색인의 manifest.json과 views.json에서 빼기 (전체 재생성 없이)
 
-            file_list.append(f'{{file: "{filename}", name: "{display_name}"}}')
+        Args:
+            files: reviews 폴더 기준 리뷰 경로 목록 (샤드 안의 리뷰면 그 샤드와 프로젝트 색인도 갱신)
+
+        Returns:
+            reviews 폴더 색인의 남은 리뷰 목록
+        """
+        with self._index_lock():
+            by_level = {self.reviews_dir: set()}
+            for filename in files:
+                path = self.reviews_dir / filename
+                for level_dir in self._index_levels(path.parent):
+                    by_level.setdefault(level_dir, set()).add(path.relative_to(level_dir).as_posix())
+
+            remaining = {
+                level_dir: self._remove_index_entries(level_dir, level_files)
+                for level_dir, level_files in by_level.items()
+            }
+            return remaining[self.reviews_dir]
+
+    def _remove_index_entries(self, level_dir, files):
+        """level_dir의 manifest.json과 views.json에서 리뷰들 빼기"""
+        reviews = [r for r in self._list_reviews(level_dir) if r["file"] not in files]
+        self._write_json("manifest.json", {"reviews": reviews}, level_dir)
+
+        views_path = level_dir / "views.json"
+        try:
+            views = json.loads(views_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            views = self._build_views(reviews)
+        else:
+            for groups in views.values():
+                for key in list(groups):
+                    groups[key] = [f for f in groups[key] if f not in files]
+                    if not groups[key]:
+                        del groups[key]
+        self._write_json("views.json", views, level_dir)
+        return reviews
+
+    def _update_summary(self, level_dir=None):
+        """SUMMARY.md 업데이트"""
+        level_dir = self.reviews_dir if level_dir is None else level_dir
+        summary_path = level_dir / "SUMMARY.md"
 
-        files_js = "[" + ", ".join(file_list) + "]"
+        summary_lines = ["# 변경 이력", ""]
+
+        for meta in self._list_reviews(level_dir):
+            line = f"- [{meta['name']}]({meta['file']})"
+            if meta["project"]:
+                line += f" — {meta['project']}"
+            summary_lines.append(line)
+
+        self._replace_text(summary_path, "\n".join(summary_lines))
+
+    def _update_pages(self, level_dir=None):
+        """level_dir의 README, SUMMARY.md, index.html 갱신"""
+        with self._index_lock():
+            self._create_readme(level_dir)
+            self._update_summary(level_dir)
+            self._update_index_html(level_dir)
+
+    def _display_name(self, md_file, meta):
+        """목록에 표시할 이름 (메타데이터의 생성 시간, 없으면 파일명에서 추출)"""
+        if meta.get("created"):
+            return meta["created"]
+        try:
+            dt = datetime.strptime(md_file.stem, "%Y%m%d_%H%M%S")
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return md_file.stem
+
+    def _update_index_html(self, level_dir=None):
+        """index.html 생성 또는 업데이트"""
+        level_dir = self.reviews_dir if level_dir is None else level_dir
+        index_path = level_dir / "index.html"
+
+        reviews = self._list_reviews(level_dir)
+
+        # 파일 목록을 JavaScript 배열로 변환 (홈 + 최신순 리뷰)
+        file_list = [json.dumps({"file": "README.md", "name": "홈", "title": ""}, ensure_ascii=False)]
+        for meta in reviews:
+            file_list.append(json.dumps(
+                {"file": meta["file"], "name": meta["name"], "title": meta["project"]},
+                ensure_ascii=False
+            ))
+
+        # </script> 조기 종료 방지
+        files_js = ("[" + ", ".join(file_list) + "]").replace("</", "<\\/")
 
         # 기본 파일 설정 (최신 파일 또는 README.md)
-        default_file = md_files[0].name if md_files else "README.md"
+        default_file = reviews[0]["file"] if reviews else "README.md"
 
         html_content = f"""<!DOCTYPE html>
 <html lang="ko">
@@ -285,6 +894,63 @@ class CodeChangeLogger:
             color: #ffffff;
         }}
 
+        #view-tabs {{
+            display: flex;
+            gap: 4px;
+            margin-bottom: 12px;
+        }}
+
+        #view-tabs button {{
+            flex: 1;
+            background: #21262d;
+            color: #8b949e;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            padding: 6px 0;
+            font-size: 12px;
+            cursor: pointer;
+        }}
+
+        #view-tabs button.active {{
+            background: #1f6feb;
+            border-color: #1f6feb;
+            color: #ffffff;
+        }}
+
+        #view-filter {{
+            width: 100%;
+            margin-bottom: 12px;
+            padding: 6px 10px;
+            background: #0d1117;
+            color: #c9d1d9;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            font-size: 13px;
+        }}
+
+        #file-list .group-title {{
+            color: #c9d1d9;
+            padding: 8px 12px;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 13px;
+            word-break: break-all;
+        }}
+
+        #file-list .group-title:hover {{
+            background: #21262d;
+        }}
+
+        #file-list .group-title span {{
+            color: #8b949e;
+            margin-left: 6px;
+        }}
+
+        #file-list ul {{
+            list-style: none;
+            margin-left: 12px;
+        }}
+
         #content {{
             flex: 1;
             overflow-y: auto;
@@ -389,6 +1055,13 @@ class CodeChangeLogger:
 <body>
     <div id="sidebar">
         <h2>📚 변경 이력</h2>
+        <div id="view-tabs">
+            <button data-view="all" class="active">날짜순</button>
+            <button data-view="by_file">파일별</button>
+            <button data-view="by_type">유형별</button>
+            <button data-view="by_day">일별</button>
+        </div>
+        <input id="view-filter" type="search" placeholder="필터" hidden>
         <ul id="file-list"></ul>
     </div>
     <div id="content">
@@ -399,32 +1072,282 @@ class CodeChangeLogger:
         const files = {files_js};
         const defaultFile = "{default_file}";
 
-        // 사이드바 생성
+        const filesByName = {{}};
+        files.forEach(item => {{ filesByName[item.file] = item; }});
+        let currentFile = null;
+
+        // 사이드바 링크 생성
         const fileList = document.getElementById('file-list');
-        files.forEach(item => {{
+        function createFileLink(item) {{
             const li = document.createElement('li');
             const a = document.createElement('a');
-            a.href = '#';
+            a.href = '#' + encodeURIComponent(item.file);
             a.textContent = item.name;
+            if (item.title) a.title = item.title;
             a.onclick = (e) => {{
                 e.preventDefault();
-                loadMarkdown(item.file);
+                openFile(item.file);
                 updateActiveLink(a);
             }};
+            if (item.file === currentFile) a.classList.add('active');
             li.appendChild(a);
-            fileList.appendChild(li);
+            return li;
+        }}
+
+        function openFile(filename) {{
+            currentFile = filename;
+            history.replaceState(null, '', '#' + encodeURIComponent(filename));
+            loadMarkdown(filename);
+        }}
+
+        // 묶음 보기 (views.json은 빌드 시 미리 계산되어 있음)
+        const TYPE_LABELS = {{
+            creation: '파일 생성',
+            modification: '파일 수정',
+            deletion: '파일 삭제',
+            bug_fix: '버그 수정',
+            refactoring: '리팩토링',
+            rename: '파일 이동',
+            copy: '파일 복사'
+        }};
+        const MAX_GROUPS = 500;
+        const viewFilter = document.getElementById('view-filter');
+        let views = null;
+        let currentView = 'all';
+
+        async function loadViews() {{
+            if (!views) {{
+                try {{
+                    const response = await fetch('views.json');
+                    views = response.ok ? await response.json() : {{}};
+                }} catch (error) {{
+                    views = {{}};
+                }}
+            }}
+            return views;
+        }}
+
+        async function showView(view) {{
+            currentView = view;
+            document.querySelectorAll('#view-tabs button').forEach(button => {{
+                button.classList.toggle('active', button.dataset.view === view);
+            }});
+            viewFilter.hidden = view === 'all';
+
+            if (view === 'all') {{
+                fileList.innerHTML = '';
+                files.forEach(item => fileList.appendChild(createFileLink(item)));
+                return;
+            }}
+            renderGroups(view, (await loadViews())[view] || {{}});
+        }}
+
+        function renderGroups(view, groups) {{
+            if (view !== currentView) return;
+            const filter = viewFilter.value.trim().toLowerCase();
+            const label = key => view === 'by_type' ? (TYPE_LABELS[key] || key) : key;
+
+            let keys = Object.keys(groups).sort();
+            if (view === 'by_day') keys.reverse();
+            if (filter) keys = keys.filter(key => label(key).toLowerCase().includes(filter));
+
+            fileList.innerHTML = '';
+            keys.slice(0, MAX_GROUPS).forEach(key => {{
+                const li = document.createElement('li');
+                const title = document.createElement('div');
+                title.className = 'group-title';
+                title.textContent = label(key);
+                const count = document.createElement('span');
+                count.textContent = groups[key].length;
+                title.appendChild(count);
+
+                let children = null;
+                title.onclick = () => {{
+                    if (children) {{
+                        children.remove();
+                        children = null;
+                        return;
+                    }}
+                    children = document.createElement('ul');
+                    groups[key].forEach(file => {{
+                        const item = filesByName[file] || {{ file: file, name: file }};
+                        children.appendChild(createFileLink(item));
+                    }});
+                    li.appendChild(children);
+                }};
+
+                li.appendChild(title);
+                fileList.appendChild(li);
+            }});
+
+            if (keys.length > MAX_GROUPS) {{
+                const more = document.createElement('li');
+                more.className = 'group-title';
+                more.textContent = `… ${{keys.length - MAX_GROUPS}}개 더 (필터로 좁혀 보세요)`;
+                fileList.appendChild(more);
+            }}
+        }}
+
+        document.querySelectorAll('#view-tabs button').forEach(button => {{
+            button.onclick = () => showView(button.dataset.view);
         }});
+        viewFilter.oninput = async () => renderGroups(currentView, (await loadViews())[currentView] || {{}});
 
-        // 마크다운 로드
+        // front matter(---로 둘러싼 메타데이터)는 화면에 표시하지 않음
+        function stripFrontMatter(text) {{
+            return text.replace(/^---\\n[\\s\\S]*?\\n---\\n/, '');
+        }}
+
+        // 섹션 지연 로드 설정
+        const INITIAL_SECTIONS = 5;
+        const SECTION_BATCH = 10;
+        let sectionObserver = null;
+        let loadToken = 0;
+
+        // 마크다운 로드 (목차가 있으면 헤더와 앞쪽 섹션만 먼저 불러옴)
         async function loadMarkdown(filename) {{
+            const container = document.getElementById('markdown-content');
+            const token = ++loadToken;
+            if (sectionObserver) {{
+                sectionObserver.disconnect();
+                sectionObserver = null;
+            }}
+
             try {{
+                const toc = await fetchToc(filename);
+                if (toc && await loadSections(filename, toc, container, token)) return;
+
                 const response = await fetch(filename);
                 const text = await response.text();
-                const html = marked.parse(text);
-                document.getElementById('markdown-content').innerHTML = html;
+                if (token !== loadToken) return;
+                container.innerHTML = marked.parse(stripFrontMatter(text));
+                attachContentLinks(container, filename);
+            }} catch (error) {{
+                if (token !== loadToken) return;
+                container.innerHTML = '<h1>오류</h1><p>파일을 불러올 수 없습니다.</p>';
+            }}
+        }}
+
+        // 섹션 목차 로드 (없으면 null)
+        async function fetchToc(filename) {{
+            try {{
+                const response = await fetch(filename.replace(/\\.md$/, '.toc.json'));
+                if (!response.ok) return null;
+                return await response.json();
             }} catch (error) {{
-                document.getElementById('markdown-content').innerHTML =
-                    '<h1>오류</h1><p>파일을 불러올 수 없습니다.</p>';
+                return null;
+            }}
+        }}
+
+        // 바이트 구간 로드 (end 미포함, 서버가 Range를 지원하지 않으면 null)
+        async function fetchRange(filename, start, end) {{
+            const response = await fetch(filename, {{
+                headers: {{ 'Range': `bytes=${{start}}-${{end - 1}}` }}
+            }});
+            if (response.status !== 206) return null;
+            return await response.text();
+        }}
+
+        // 헤더 + 첫 섹션들을 표시하고 나머지는 스크롤 시 로드
+        async function loadSections(filename, toc, container, token) {{
+            const header = await fetchRange(filename, toc.header[0], toc.header[1]);
+            if (header === null || token !== loadToken) return header !== null;
+
+            container.innerHTML = marked.parse(stripFrontMatter(header));
+            attachContentLinks(container, filename);
+            const sentinel = document.createElement('div');
+            container.appendChild(sentinel);
+
+            let next = 0;
+            let loading = false;
+
+            async function loadMore(count) {{
+                if (loading || next >= toc.sections.length) return;
+                loading = true;
+
+                const batch = toc.sections.slice(next, next + count);
+                const text = await fetchRange(filename, batch[0].start, batch[batch.length - 1].end);
+                if (token !== loadToken) return;
+                if (text !== null) {{
+                    const block = document.createElement('div');
+                    block.innerHTML = marked.parse(text);
+                    attachContentLinks(block, filename);
+                    container.insertBefore(block, sentinel);
+                    next += batch.length;
+                }}
+                loading = false;
+
+                if (text === null || next >= toc.sections.length) {{
+                    if (sectionObserver) sectionObserver.disconnect();
+                    sentinel.remove();
+                }} else if (sectionObserver) {{
+                    // 센티널이 계속 보이면 다음 묶음을 이어서 로드
+                    sectionObserver.unobserve(sentinel);
+                    sectionObserver.observe(sentinel);
+                }}
+            }}
+
+            await loadMore(INITIAL_SECTIONS);
+            if (token !== loadToken || next >= toc.sections.length) return true;
+
+            sectionObserver = new IntersectionObserver(entries => {{
+                if (entries.some(entry => entry.isIntersecting)) loadMore(SECTION_BATCH);
+            }}, {{ root: document.getElementById('content'), rootMargin: '400px' }});
+            sectionObserver.observe(sentinel);
+            return true;
+        }}
+
+        // "전체 내용 보기" 링크: 클릭 시 압축된 전체 내용을 불러와 표시
+        const CONTENT_LABELS = {{
+            content: '전체 내용',
+            old_content: '변경 전 (전체)',
+            new_content: '변경 후 (전체)',
+            diff: 'diff (전체)'
+        }};
+
+        // 전체 내용 링크는 리뷰 문서 기준 상대 경로 (프로젝트 샤드 안의 문서도 처리)
+        function attachContentLinks(root, filename) {{
+            const base = new URL(filename, location.href);
+            root.querySelectorAll('a[href$=".json.gz"]').forEach(a => {{
+                a.onclick = async (e) => {{
+                    e.preventDefault();
+                    if (a.dataset.loaded) return;
+                    a.dataset.loaded = '1';
+                    try {{
+                        const payload = await fetchContent(new URL(a.getAttribute('href'), base));
+                        const target = a.closest('p') || a;
+                        const block = document.createElement('div');
+                        Object.keys(CONTENT_LABELS).forEach(field => {{
+                            if (!(field in payload)) return;
+                            const label = document.createElement('p');
+                            label.innerHTML = `<strong>${{CONTENT_LABELS[field]}}:</strong>`;
+                            const pre = document.createElement('pre');
+                            const code = document.createElement('code');
+                            code.textContent = payload[field];
+                            pre.appendChild(code);
+                            block.appendChild(label);
+                            block.appendChild(pre);
+                        }});
+                        target.after(block);
+                        a.textContent = '전체 내용 (불러옴)';
+                    }} catch (error) {{
+                        delete a.dataset.loaded;
+                        a.textContent = '전체 내용을 불러올 수 없습니다. 다시 시도';
+                    }}
+                }};
+            }});
+        }}
+
+        async function fetchContent(href) {{
+            const response = await fetch(href);
+            if (!response.ok) throw new Error(response.statusText);
+            const buffer = await response.arrayBuffer();
+            try {{
+                const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+                return JSON.parse(await new Response(stream).text());
+            }} catch (error) {{
+                // 서버가 Content-Encoding으로 이미 압축을 풀어 보낸 경우
+                return JSON.parse(new TextDecoder().decode(buffer));
             }}
         }}
 
@@ -436,23 +1359,26 @@ class CodeChangeLogger:
             activeLink.classList.add('active');
         }}
 
-        // 초기 로드
+        // 초기 로드 (주소의 #파일명이 있으면 그 문서부터)
+        const requested = decodeURIComponent(location.hash.slice(1));
+        currentFile = filesByName[requested] ? requested : defaultFile;
+        showView('all');
         if (files.length > 0) {{
-            loadMarkdown(defaultFile);
-            const firstLink = document.querySelector('#file-list a');
-            if (firstLink) updateActiveLink(firstLink);
+            loadMarkdown(currentFile);
         }}
     </script>
 </body>
 </html>"""
 
-        index_path.write_text(html_content, encoding="utf-8")
+        self._replace_text(index_path, html_content)
 
-    def _create_readme(self):
-        """README.md 생성"""
-        readme_path = self.reviews_dir / "README.md"
+    def _create_readme(self, level_dir=None):
+        """README.md 생성 (프로젝트 폴더면 제목은 프로젝트 폴더 이름)"""
+        level_dir = self.reviews_dir if level_dir is None else level_dir
+        title = self.project_name if level_dir == self.reviews_dir else level_dir.name
+        readme_path = level_dir / "README.md"
         if not readme_path.exists():
-            readme_content = f"""# {self.project_name} - 코드 변경 이력
+            readme_content = f"""# {title} - 코드 변경 이력
 
 이 폴더에는 AI가 생성한 모든 코드 변경사항이 기록되어 있습니다.
 
@@ -483,12 +1409,7 @@ python3 -m http.server 4000
             print("기록할 변경사항이 없습니다.")
             return
 
-        # 마크다운 파일 생성
-        filename = f"{self.timestamp}.md"
-        filepath = self.reviews_dir / filename
-
-        md_content = self._generate_markdown()
-        filepath.write_text(md_content, encoding="utf-8")
+        filepath = self._write_review(self.changes)
 
         print(f"✅ 변경사항 저장 완료: {filepath}")
         return filepath
@@ -497,31 +1418,150 @@ python3 -m http.server 4000
         """저장 + SUMMARY 업데이트"""
         filepath = self.save_review()
         if filepath:
-            self._update_summary()
+            with self._index_lock():
+                for level_dir in self._page_levels():
+                    self._update_summary(level_dir)
             print(f"✅ SUMMARY.md 업데이트 완료")
 
     def save_and_build(self):
         """저장 + SUMMARY 업데이트 + index.html 업데이트"""
         filepath = self.save_review()
         if filepath:
-            self._create_readme()
-            self._update_summary()
-            self._update_index_html()
-            print(f"✅ SUMMARY.md 업데이트 완료")
-            print(f"✅ index.html 업데이트 완료")
-            print(f"\n🌐 서버 실행: cd reviews && python3 -m http.server {self.port}")
-            print(f"📱 브라우저: http://localhost:{self.port}")
+            self._build_outputs()
+
+    def _build_outputs(self):
+        """README, SUMMARY.md, index.html 갱신"""
+        for level_dir in self._page_levels():
+            self._update_pages(level_dir)
+        print(f"✅ SUMMARY.md 업데이트 완료")
+        print(f"✅ index.html 업데이트 완료")
+        serve_args = f"{self.port} --project {self.project}" if self.project else self.port
+        print(f"\n🌐 서버 실행: python3 code_changelog_tracker.py serve {serve_args}")
+        print(f"📱 브라우저: http://localhost:{self.port}")
+
+
+def iter_jsonl(lines):
+    """
+    JSONL 줄들을 하나씩 파싱해서 내보냄 (빈 줄은 건너뜀)
+
+    Raises:
+        ValueError: JSON으로 읽을 수 없는 줄이 있을 때 (줄 번호 포함)
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"{line_number}번째 줄을 JSON으로 읽을 수 없습니다: {e}") from None
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """HTTP Range 요청(단일 바이트 범위)을 지원하는 정적 파일 핸들러"""
+
+    RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+    def send_head(self):
+        """Range 헤더가 있으면 206 응답 헤더를 보내고 해당 구간만 읽도록 준비"""
+        self._range = None
+        range_header = self.headers.get("Range")
+        path = self.translate_path(self.path)
+
+        if not range_header or os.path.isdir(path):
+            return super().send_head()
+
+        # 다중 범위 등 해석할 수 없는 Range는 무시하고 전체 응답
+        match = self.RANGE_PATTERN.match(range_header.strip())
+        if not match or match.group(1) == match.group(2) == "":
+            return super().send_head()
+
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            size = os.fstat(f.fileno()).st_size
+            first, last = match.groups()
+            if first == "":
+                # bytes=-N: 마지막 N바이트
+                start = max(size - int(last), 0)
+                end = size - 1
+            else:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+
+            if start >= size or start > end:
+                f.close()
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            self.send_response(206)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Last-Modified", self.date_time_string(os.fstat(f.fileno()).st_mtime))
+            self.end_headers()
+
+            f.seek(start)
+            self._range = (start, end)
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def end_headers(self):
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """Range 응답이면 요청된 구간만 전송"""
+        if self._range is None:
+            return super().copyfile(source, outputfile)
+
+        start, end = self._range
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = source.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
 
 
 def main():
     """CLI 인터페이스"""
     import sys
 
+    def pop_project_option():
+        """sys.argv에서 --project 폴더 옵션을 꺼냄 (없으면 None)"""
+        if "--project" not in sys.argv:
+            return None
+        i = sys.argv.index("--project")
+        if i + 1 >= len(sys.argv):
+            print("❌ --project 뒤에 프로젝트 폴더 이름을 입력하세요.")
+            sys.exit(1)
+        project = sys.argv[i + 1]
+        del sys.argv[i:i + 2]
+        return project
+
     if len(sys.argv) < 2:
         print("사용법:")
         print("  python3 code_changelog_tracker.py init    - 초기화")
-        print("  python3 code_changelog_tracker.py build   - 빌드")
-        print("  python3 code_changelog_tracker.py serve   - 서버 실행")
+        print("  python3 code_changelog_tracker.py build [--project 폴더]   - 빌드")
+        print("  python3 code_changelog_tracker.py serve [포트] [--project 폴더]   - 서버 실행")
+        print("  python3 code_changelog_tracker.py log 프로젝트명 [요구사항] [--project 폴더] < changes.jsonl")
+        print("                                            - JSONL 변경사항 대량 기록")
+        print("  (--project: reviews/<폴더>/<yyyy>/<mm>/ 멀티 프로젝트 레이아웃, 빌드/서버는 그 프로젝트만)")
+        print("  python3 code_changelog_tracker.py export [폴더] - 정적 사이트로 내보내기 (기본: site)")
+        print("  python3 code_changelog_tracker.py retention [--max-age-days N] [--max-bytes 500M]")
+        print("                                            [--keep-last N] [--archive 폴더] [--dry-run]")
+        print("                                            - 오래된 리뷰 정리")
         return
 
     command = sys.argv[1]
@@ -537,24 +1577,121 @@ def main():
             print("❌ reviews 폴더가 없습니다. 먼저 init을 실행하세요.")
             return
 
+        project = pop_project_option()
         logger = CodeChangeLogger("Rebuild", "")
-        logger._create_readme()
-        logger._update_summary()
-        logger._update_index_html()
+        if project is None:
+            # 전체 재생성 (프로젝트 폴더가 있으면 각 프로젝트 페이지도)
+            logger._rebuild_index()
+            for project_dir in logger._child_levels(reviews_dir):
+                logger._update_pages(project_dir)
+        else:
+            # 이 프로젝트의 샤드만 다시 훑고, 다른 프로젝트는 기존 manifest.json을 합침
+            project_dir = reviews_dir / project
+            if not project_dir.is_dir():
+                print(f"❌ 프로젝트 폴더가 없습니다: {project_dir}")
+                return
+            logger._rebuild_index(rescan=lambda d: d == project_dir or project_dir in d.parents)
+            logger._update_pages(project_dir)
+        logger._update_pages()
         print("✅ 빌드 완료!")
 
+    elif command == "log":
+        project = pop_project_option()
+        if len(sys.argv) < 3:
+            print("❌ 프로젝트명을 입력하세요: log 프로젝트명 [요구사항] < changes.jsonl")
+            return
+
+        user_request = sys.argv[3] if len(sys.argv) > 3 else ""
+        try:
+            logger = CodeChangeLogger(sys.argv[2], user_request, project=project)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        try:
+            logger.log_changes(iter_jsonl(sys.stdin))
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    elif command == "export":
+        from changelog_export import export_site, brotli
+
+        reviews_dir = Path("reviews")
+        if not reviews_dir.exists():
+            print("❌ reviews 폴더가 없습니다. 먼저 init을 실행하세요.")
+            return
+
+        output_dir = sys.argv[2] if len(sys.argv) > 2 else "site"
+        try:
+            result = export_site(reviews_dir, output_dir)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ 내보내기 완료: {output_dir}/")
+        print(f"   새로 쓴 파일 {result['written']}개, 압축본 {result['compressed']}개, "
+              f"정리한 파일 {result['removed']}개")
+        if brotli is None:
+            print("   (brotli 모듈이 없어 .br 압축본은 만들지 않았습니다: pip install brotli)")
+
+    elif command == "retention":
+        import argparse
+        from changelog_retention import apply_retention
+
+        def parse_size(value):
+            units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+            value = value.strip().upper().rstrip("B")
+            if value and value[-1] in units:
+                return int(float(value[:-1]) * units[value[-1]])
+            return int(value)
+
+        parser = argparse.ArgumentParser(prog="code_changelog_tracker.py retention")
+        parser.add_argument("--max-age-days", type=float, help="이 일수보다 오래된 리뷰 정리")
+        parser.add_argument("--max-bytes", type=parse_size, help="전체 크기 상한 (예: 500M, 2G)")
+        parser.add_argument(
+            "--keep-last", type=int,
+            help="프로젝트 폴더별로 최신 N개만 유지 (reviews 바로 아래 리뷰는 한 묶음)"
+        )
+        parser.add_argument("--archive", help="삭제 대신 옮길 보관 폴더")
+        parser.add_argument("--dry-run", action="store_true", help="대상만 출력")
+        args = parser.parse_args(sys.argv[2:])
+
+        if args.max_age_days is None and args.max_bytes is None and args.keep_last is None:
+            print("❌ --max-age-days, --max-bytes, --keep-last 중 하나 이상을 지정하세요.")
+            return
+        if not Path("reviews").exists():
+            print("❌ reviews 폴더가 없습니다. 먼저 init을 실행하세요.")
+            return
+
+        expired = apply_retention(
+            "reviews",
+            archive_dir=args.archive,
+            dry_run=args.dry_run,
+            max_age_days=args.max_age_days,
+            max_bytes=args.max_bytes,
+            keep_last=args.keep_last
+        )
+        action = "정리 대상" if args.dry_run else ("보관" if args.archive else "삭제")
+        for filename in expired:
+            print(f"  [{action}] {filename}")
+        print(f"✅ {action} {len(expired)}개")
+
     elif command == "serve":
-        import http.server
         import socketserver
 
+        project = pop_project_option()
         port = 4000
         if len(sys.argv) > 2:
             port = int(sys.argv[2])
 
-        os.chdir("reviews")
+        # 프로젝트를 지정하면 그 프로젝트 폴더만 서비스
+        serve_dir = Path("reviews") if project is None else Path("reviews") / project
+        if not serve_dir.is_dir():
+            print(f"❌ {serve_dir} 폴더가 없습니다. 먼저 init을 실행하세요.")
+            return
+        os.chdir(serve_dir)
 
-        Handler = http.server.SimpleHTTPRequestHandler
-        with socketserver.TCPServer(("", port), Handler) as httpd:
+        Handler = RangeRequestHandler
+        with socketserver.ThreadingTCPServer(("", port), Handler) as httpd:
             print(f"🌐 서버 실행 중: http://localhost:{port}")
             print("종료하려면 Ctrl+C를 누르세요.")
             httpd.serve_forever()